@@ -4,15 +4,55 @@
 
 from __future__ import annotations
 
+import logging
+import math
+import statistics
+import time
+from collections import deque
+from datetime import UTC, datetime
+from functools import cached_property
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, override
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from singer_sdk import RESTStream
 from singer_sdk.authenticators import BearerTokenAuthenticator
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.pagination import JSONPathPaginator
+from singer_sdk.singerlib.catalog import REPLICATION_FULL_TABLE
+from singer_sdk.streams.rest import DEFAULT_REQUEST_TIMEOUT
 
 if TYPE_CHECKING:
-    from requests import Response
-    from singer_sdk.helpers.types import Context
+    from collections.abc import Iterable
+
+    from backoff.types import Details
+    from requests import PreparedRequest, Response
+    from singer_sdk.helpers.types import Context, RequestFunc
+
+# https://www.eventbrite.com/platform/api#/introduction/errors
+RETRIABLE_ERRORS = frozenset({
+    "HIT_RATE_LIMIT",
+    "INTERNAL_ERROR",
+})
+FATAL_ERRORS = frozenset({
+    "ARGUMENTS_ERROR",
+    "BAD_PAGE",
+    "INVALID_AUTH",
+    "INVALID_AUTH_HEADER",
+    "METHOD_NOT_ALLOWED",
+    "NO_AUTH",
+    "NOT_AUTHORIZED",
+    "NOT_FOUND",
+})
+# Errors returned for a continuation token the API no longer accepts
+STALE_TOKEN_ERRORS = frozenset({
+    "ARGUMENTS_ERROR",
+    "BAD_PAGE",
+})
+
+
+class StaleContinuationError(FatalAPIError):
+    """A continuation token from a resume bookmark was rejected by the API."""
 
 
 class EventbritePaginator(JSONPathPaginator):
@@ -24,10 +64,119 @@ class EventbritePaginator(JSONPathPaginator):
         pagination = response.json().get("pagination", {})
         return pagination.get("has_more_items", False)  # type: ignore[no-any-return]
 
+    @override
+    def continue_if_empty(self, response: Response) -> bool:
+        """Keep paginating past empty pages.
+
+        A resumed page is empty once its already-sent records are skipped.
+
+        Returns:
+            True if the endpoint has more pages.
+        """
+        return self.has_more(response)
+
+
+class AdaptivePageSize:
+    """Page size and request timeout tuned from observed response latency.
+
+    Pages grow while responses are fast and small, and are halved when a response is
+    slow, too large, or the request times out (at the transport level or with a 504
+    from a gateway). Other server errors don't say anything about the page size, so
+    they are retried with the same size.
+    The request timeout is a multiple of a high percentile of recent latencies.
+
+    Latency is the time until response headers arrive (`Response.elapsed`), so it
+    excludes downloading the body. Body size stands in for that cost, which is the
+    part that grows with the page size.
+    """
+
+    min_samples = 5
+
+    def __init__(  # ruff: ignore[too-many-arguments]
+        self,
+        *,
+        initial: int = 50,
+        minimum: int = 10,
+        maximum: int = 200,
+        target_latency: float = 2.0,
+        max_page_bytes: int = 2_000_000,
+        percentile: int = 95,
+        timeout_factor: float = 3.0,
+        min_timeout: int = 10,
+        max_timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        window: int = 100,
+    ) -> None:
+        """Initialize the tuner.
+
+        Args:
+            initial: Page size used for the first request.
+            minimum: Smallest page size to request.
+            maximum: Largest page size to request.
+            target_latency: Response time in seconds under which pages may grow.
+            max_page_bytes: Response body size above which pages shrink.
+            percentile: Latency percentile the request timeout is derived from.
+            timeout_factor: Multiplier applied to the latency percentile.
+            min_timeout: Lower bound for the request timeout, in seconds.
+            max_timeout: Upper bound for the request timeout, in seconds.
+            window: Number of recent latencies to keep.
+        """
+        self.page_size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        self.percentile = percentile
+        self.timeout_factor = timeout_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    @property
+    def timeout(self) -> int:
+        """Request timeout in seconds."""
+        if len(self._latencies) < self.min_samples:
+            return self.max_timeout
+
+        cut_points = statistics.quantiles(self._latencies, n=100, method="inclusive")
+        timeout = math.ceil(cut_points[self.percentile - 1] * self.timeout_factor)
+        return max(self.min_timeout, min(self.max_timeout, timeout))
+
+    def observe(self, elapsed: float, size: int) -> None:
+        """Record a successful response and adjust the page size.
+
+        Args:
+            elapsed: Time until the response headers arrived, in seconds.
+            size: Response body size in bytes.
+        """
+        self._latencies.append(elapsed)
+        if elapsed > 2 * self.target_latency or size > self.max_page_bytes:
+            self._shrink()
+        elif elapsed < self.target_latency and size * 1.5 <= self.max_page_bytes:
+            self.page_size = min(self.maximum, math.ceil(self.page_size * 1.5))
+
+    def observe_failure(self) -> None:
+        """Record a request that failed before a response was received."""
+        self._latencies.append(self.timeout)
+        self._shrink()
+
+    def _shrink(self) -> None:
+        self.page_size = max(self.minimum, self.page_size // 2)
+
 
 class EventbriteStream(RESTStream[Any]):
     """Eventbrite stream class."""
 
+    page_size_param: str | None = "page_size"
+    """Query parameter that sets the page size, or None if the endpoint has none."""
+
+    # Resume bookkeeping for the partition being synced
+    _page_token: str | None = None
+    _request_page_size: int | None = None
+    _resume: dict[str, Any] | None = None
+    _resuming: bool = False
+    _resume_after_id: str | None = None
+    _last_state_message: float = -math.inf
+
     @override
     @property
     def url_base(self) -> str:
@@ -39,6 +188,16 @@ class EventbriteStream(RESTStream[Any]):
     def authenticator(self) -> BearerTokenAuthenticator:
         return BearerTokenAuthenticator(token=self.config["token"])
 
+    @cached_property
+    def page_tuner(self) -> AdaptivePageSize:
+        """Adaptive page size and timeout for this stream's requests."""
+        return AdaptivePageSize()
+
+    @override
+    @property
+    def timeout(self) -> int:
+        return self.page_tuner.timeout
+
     @override
     def get_new_paginator(self) -> EventbritePaginator:
         return EventbritePaginator(jsonpath="$.pagination.continuation")
@@ -49,6 +208,285 @@ class EventbriteStream(RESTStream[Any]):
         context: Context | None,
         next_page_token: str | None,
     ) -> dict[str, Any]:
-        return {
+        page_size = self.page_tuner.page_size
+        if next_page_token is None and self._resume is not None:
+            # Request the bookmarked page again, with the size it was requested with,
+            # so that it holds the same records.
+            next_page_token = self._resume.get("continuation")
+            page_size = self._resume.get("page_size") or page_size
+            self._resume_after_id = self._resume.get("last_record_id")
+            self._resume = None
+            self._resuming = True
+
+        self._page_token = next_page_token
+        self._request_page_size = page_size
+        params: dict[str, Any] = {
             "continuation": next_page_token,
         }
+        if self.page_size_param:
+            params[self.page_size_param] = page_size
+        return params
+
+    @override
+    def validate_response(self, response: Response) -> None:
+        if response.status_code >= HTTPStatus.BAD_REQUEST:
+            error = get_error_code(response)
+            if self._resuming and self._page_token and error in STALE_TOKEN_ERRORS:
+                raise StaleContinuationError(self.response_error_message(response))
+            if error in RETRIABLE_ERRORS:
+                raise RetriableAPIError(self.response_error_message(response), response)
+            if error in FATAL_ERRORS:
+                raise FatalAPIError(self.response_error_message(response))
+
+        super().validate_response(response)
+        self.page_tuner.observe(response.elapsed.total_seconds(), len(response.content))
+
+    @override
+    def request_decorator(self, func: RequestFunc) -> RequestFunc:
+        def request(prepared_request: PreparedRequest, context: Context | None) -> Response:
+            return func(self._resize_request(prepared_request), context)
+
+        return super().request_decorator(request)
+
+    def _resize_request(self, prepared_request: PreparedRequest) -> PreparedRequest:
+        """Apply the current page size to a request that is being retried.
+
+        A resumed page keeps its bookmarked size, so that it holds the same records.
+
+        Returns:
+            The request, with the page size updated in place.
+        """
+        page_size = self.page_tuner.page_size
+        if not self.page_size_param or self._resuming or self._request_page_size == page_size:
+            return prepared_request
+
+        url = urlsplit(prepared_request.url or "")
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+        query[self.page_size_param] = str(page_size)
+        prepared_request.url = url._replace(query=urlencode(query)).geturl()
+        self._request_page_size = page_size
+        return prepared_request
+
+    @override
+    def backoff_handler(self, details: Details) -> None:
+        exception = details.get("exception")
+        if not isinstance(exception, RetriableAPIError) or (
+            exception.response is not None
+            and exception.response.status_code == HTTPStatus.GATEWAY_TIMEOUT
+        ):
+            # Timeouts and dropped connections, most likely from an oversized page
+            self.page_tuner.observe_failure()
+        super().backoff_handler(details)
+        self.log(
+            "Retrying page with continuation token %s and page size %s",
+            self._page_token,
+            self.page_tuner.page_size,
+        )
+
+    @override
+    def _write_state_message(self) -> None:
+        # The SDK offers no public hook for when STATE is written, hence this override.
+        # Child streams write state after every partition. Their state is shared with
+        # the parent stream, whose messages (including the final one) are never
+        # throttled, so skipping some of them loses nothing at the end of a sync. A
+        # crash, however, loses up to `state_message_interval` seconds of bookmarks.
+        # Compacting first keeps throttled state compact too, for when the parent
+        # stream writes it.
+        if not self.state_manager.is_flushed:
+            self.compact_state()
+
+        interval = self.config.get("state_message_interval", 0)
+        if self.parent_stream_type and time.monotonic() - self._last_state_message < interval:
+            return
+
+        super()._write_state_message()
+        self._last_state_message = time.monotonic()
+
+    def compact_state(self) -> None:
+        """Drop partition state this stream would not resume from.
+
+        Old bookmarks are only dropped if the replication key is a timestamp, since
+        that is when the SDK applies the ``start_date`` setting.
+        """
+        floor = self.config.get("start_date") if self.is_timestamp_replication_key else None
+        compact_stream_state(self.stream_state, floor)
+
+    @property
+    def resumable(self) -> bool:
+        """Whether an interrupted sync resumes after the last record sent.
+
+        Not for full-table syncs that emit ACTIVATE_VERSION messages, since the target
+        would then delete the records skipped on resume.
+        """
+        return not (
+            self.replication_method == REPLICATION_FULL_TABLE
+            and self.emit_activate_version_messages
+        )
+
+    @override
+    def get_records(self, context: Context | None) -> Iterable[dict[str, Any]]:
+        """Return records, resuming from the last record sent by an interrupted sync.
+
+        The continuation token and size of the page being sent, and the ID of the last
+        record sent from it, are kept in the partition state. A restarted sync requests
+        that page again and skips the records already sent. If the API rejects the
+        token, the partition is synced from the start. The bookmark is cleared once the
+        partition completes.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            Each record from the source.
+        """
+        resume = (self.find_context_state(context) or {}).get("resume")
+        if resume and self.resumable:
+            self.log("Resuming '%s' after record %s", self.name, resume["last_record_id"])
+            try:
+                yield from self._get_bookmarked_records(context, resume)
+            except StaleContinuationError:
+                self.log(
+                    "Continuation token for '%s' was rejected, syncing from the start",
+                    self.name,
+                    level=logging.WARNING,
+                )
+                self._clear_resume(context)
+                yield from self._get_bookmarked_records(context, None)
+        else:
+            yield from self._get_bookmarked_records(context, None)
+
+        self._clear_resume(context)
+
+    def _get_bookmarked_records(
+        self,
+        context: Context | None,
+        resume: dict[str, Any] | None,
+    ) -> Iterable[dict[str, Any]]:
+        self._resume = resume
+        self._resuming = False
+        self._resume_after_id = None
+        try:
+            for record in super().get_records(context):
+                page_token, page_size = self._page_token, self._request_page_size
+                yield record
+                # Execution resumes once the SDK has written the record and synced
+                # its child streams, so the record can be bookmarked as sent.
+                if self.resumable:
+                    self.get_context_state(context)["resume"] = {
+                        "continuation": page_token,
+                        "page_size": page_size,
+                        "last_record_id": record["id"],
+                    }
+        except StaleContinuationError:
+            raise
+        except Exception:
+            # Emit the latest bookmark, unthrottled, so a restarted sync skips what
+            # was sent
+            self._last_state_message = -math.inf
+            self._write_state_message()
+            raise
+
+    def _clear_resume(self, context: Context | None) -> None:
+        state = self.find_context_state(context)
+        if state and "resume" in state:
+            del state["resume"]
+            self.state_manager.is_flushed = False
+
+    @override
+    def parse_response(self, response: Response) -> Iterable[dict[str, Any]]:
+        self._resuming = False
+        records = super().parse_response(response)
+        if self._resume_after_id is None:
+            yield from records
+            return
+
+        page = list(records)
+        ids = [record.get("id") for record in page]
+        skip = ids.index(self._resume_after_id) + 1 if self._resume_after_id in ids else 0
+        self._resume_after_id = None
+        yield from page[skip:]
+
+    def find_context_state(self, context: Context | None) -> dict[str, Any] | None:
+        """Return the state for a context without creating an empty entry.
+
+        Unlike `get_context_state`, partitions that were never bookmarked don't get a
+        state entry, so state does not grow with every partition synced.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The partition (or stream) state, or None if there is none yet.
+        """
+        partition = self.state_manager.get_state_partition_context(context)
+        if partition is None:
+            return self.stream_state
+
+        return next(
+            (
+                partition_state
+                for partition_state in self.stream_state.get("partitions", [])
+                if partition_state["context"] == partition
+            ),
+            None,
+        )
+
+
+def get_error_code(response: Response) -> str | None:
+    """Return the Eventbrite error code from an error response, if any.
+
+    Args:
+        response: A failed API response.
+
+    Returns:
+        The value of the ``error`` field, e.g. ``HIT_RATE_LIMIT``.
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    return body.get("error") if isinstance(body, dict) else None
+
+
+def compact_stream_state(stream_state: dict[str, Any], floor: str | None = None) -> None:
+    """Drop partition state that a sync would not resume from, in place.
+
+    Partitions with no bookmarks left (e.g. finished partitions whose resume
+    bookmark was cleared) are removed, as are partitions whose only bookmark is a
+    timestamp at or before `floor`, since a sync starts from the floor anyway. This
+    keeps STATE messages proportional to the partitions in progress rather than to
+    every partition ever synced.
+
+    Args:
+        stream_state: The state of a stream.
+        floor: The start date, if any, for a stream with a timestamp replication key.
+    """
+    floor_dt = _parse_datetime(floor) if floor else None
+    partitions = [
+        partition_state
+        for partition_state in stream_state.get("partitions", [])
+        if not _is_disposable(partition_state, floor_dt)
+    ]
+    if partitions:
+        stream_state["partitions"] = partitions
+    else:
+        stream_state.pop("partitions", None)
+
+
+def _is_disposable(partition_state: dict[str, Any], floor: datetime | None) -> bool:
+    bookmarks = {k: v for k, v in partition_state.items() if k != "context" and v not in (None, {})}
+    if not bookmarks:
+        return True
+
+    if floor is None or bookmarks.keys() != {"replication_key", "replication_key_value"}:
+        return False
+
+    try:
+        return _parse_datetime(bookmarks["replication_key_value"]) <= floor
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_datetime(value: str) -> datetime:
+    result = datetime.fromisoformat(value)
+    return result if result.tzinfo else result.replace(tzinfo=UTC)
@@ -0,0 +1,243 @@
+# Copyright (c) 2026 Edgar-Ramírez Mondragón
+
+"""Profiling of tap syncs."""
+
+from __future__ import annotations
+
+import cProfile
+import dataclasses
+import functools
+import json
+import time
+import tracemalloc
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from contextvars import Token
+    from pathlib import Path
+    from types import TracebackType
+
+    from singer_sdk import Stream
+
+PSTATS_FILENAME = "sync.pstats"
+SUMMARY_FILENAME = "summary.json"
+
+# Stream methods timed for each phase of a sync. Generators are timed on each
+# `next()` call, so time spent by the caller between records is not included.
+PHASES = {
+    # Requesting and parsing pages
+    "fetch": "get_records",
+    "post_process": "post_process",
+    # Dropping deselected properties, type conformance and stream maps
+    "conform": "_generate_record_messages",
+    # Serializing and writing RECORD messages, excluding conformance
+    "output": "_write_record_message",
+    "state": "_write_state_message",
+}
+_GENERATOR_PHASES = frozenset({"fetch", "conform"})
+
+_active: ContextVar[SyncProfiler | None] = ContextVar("profiler", default=None)
+
+
+@dataclasses.dataclass(slots=True)
+class PhaseProfile:
+    """Time and memory spent in one phase of a stream's sync."""
+
+    seconds: float = 0.0
+    allocated_bytes: int = 0
+
+
+@dataclasses.dataclass(slots=True)
+class StreamProfile:
+    """Records synced by a stream and the cost of each phase."""
+
+    records: int = 0
+    phases: dict[str, PhaseProfile] = dataclasses.field(
+        default_factory=lambda: {phase: PhaseProfile() for phase in PHASES},
+    )
+
+
+class SyncProfiler:
+    """Profile a sync, writing a pstats file and a per-stream summary.
+
+    By default the whole sync runs under :mod:`cProfile`. The pstats file can be
+    explored with ``python -m pstats`` or snakeviz, or rendered as a flamegraph with
+    flameprof.
+
+    The summary breaks each stream's time down by phase (see `PHASES`). Time is
+    exclusive: phases of child streams, which sync while their parent record is being
+    processed, are not counted towards the parent.
+
+    With ``memory=True``, memory allocations are traced with :mod:`tracemalloc`
+    instead of running cProfile, and each phase also reports the bytes it allocated
+    and did not free before returning. Tracing slows the sync down, so timings from a
+    memory pass are inflated.
+    """
+
+    def __init__(self, output_dir: Path, *, memory: bool = False) -> None:
+        """Initialize the profiler.
+
+        Args:
+            output_dir: Directory to write the profile to. Created if missing.
+            memory: Trace memory allocations instead of profiling function calls.
+        """
+        self.output_dir = output_dir
+        self.memory = memory
+        self.streams: dict[str, StreamProfile] = {}
+        self._profiler = None if memory else cProfile.Profile()
+        self._started_tracemalloc = False
+        self._started_at = 0.0
+        self._stack: list[tuple[PhaseProfile, float, int]] = []
+        self._token: Token[SyncProfiler | None] | None = None
+
+    def __enter__(self) -> Self:
+        """Start profiling.
+
+        Returns:
+            The profiler.
+        """
+        self._token = _active.set(self)
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._started_at = time.perf_counter()
+        if self._profiler is not None:
+            self._profiler.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop profiling and write the results."""
+        if self._profiler is not None:
+            self._profiler.disable()
+        elapsed = time.perf_counter() - self._started_at
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        if self._token is not None:
+            _active.reset(self._token)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self._profiler is not None:
+            self._profiler.dump_stats(self.output_dir / PSTATS_FILENAME)
+        (self.output_dir / SUMMARY_FILENAME).write_text(
+            json.dumps(self.summary(elapsed), indent=2),
+        )
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        """Return the per-stream summary.
+
+        Args:
+            elapsed: Total duration of the sync, in seconds.
+
+        Returns:
+            A JSON-serializable summary.
+        """
+        streams = {}
+        for name, profile in self.streams.items():
+            phases = {}
+            for phase, phase_profile in profile.phases.items():
+                phases[phase] = dataclasses.asdict(phase_profile)
+                if not self.memory:
+                    del phases[phase]["allocated_bytes"]
+            streams[name] = {"records": profile.records, "phases": phases}
+
+        return {"seconds": elapsed, "memory": self.memory, "streams": streams}
+
+    def instrument(self, stream: Stream) -> None:
+        """Time the phases of a stream's sync.
+
+        Args:
+            stream: The stream to instrument.
+        """
+        profile = self.streams.setdefault(stream.name, StreamProfile())
+        for phase, method_name in PHASES.items():
+            method = getattr(stream, method_name)
+            wrap = self._wrap_generator if phase in _GENERATOR_PHASES else self._wrap
+            wrapper = wrap(method, profile.phases[phase])
+            if phase == "fetch":
+                wrapper = self._count_records(wrapper, profile)
+            setattr(stream, method_name, wrapper)
+
+    def _wrap(self, func: Callable[..., Any], phase: PhaseProfile) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # ruff: ignore[any-type]
+            self._push(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._pop()
+
+        return wrapper
+
+    def _wrap_generator(
+        self,
+        func: Callable[..., Iterable[Any]],
+        phase: PhaseProfile,
+    ) -> Callable[..., Iterator[Any]]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            iterator = iter(func(*args, **kwargs))
+            while True:
+                self._push(phase)
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    self._pop()
+                yield item
+
+        return wrapper
+
+    @staticmethod
+    def _count_records(
+        func: Callable[..., Iterator[Any]],
+        profile: StreamProfile,
+    ) -> Callable[..., Iterator[Any]]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            for record in func(*args, **kwargs):
+                profile.records += 1
+                yield record
+
+        return wrapper
+
+    def _memory(self) -> int:
+        return tracemalloc.get_traced_memory()[0] if self.memory else 0
+
+    def _push(self, phase: PhaseProfile) -> None:
+        now, memory = time.perf_counter(), self._memory()
+        if self._stack:
+            # Pause the enclosing phase, so time is only counted once
+            self._charge(self._stack[-1], now, memory)
+        self._stack.append((phase, now, memory))
+
+    def _pop(self) -> None:
+        now, memory = time.perf_counter(), self._memory()
+        self._charge(self._stack.pop(), now, memory)
+        if self._stack:
+            phase, _, _ = self._stack[-1]
+            self._stack[-1] = (phase, now, memory)
+
+    @staticmethod
+    def _charge(entry: tuple[PhaseProfile, float, int], now: float, memory: int) -> None:
+        phase, started, memory_before = entry
+        phase.seconds += now - started
+        phase.allocated_bytes += max(0, memory - memory_before)
+
+
+def instrument(streams: Iterable[Stream]) -> None:
+    """Time the phases of the given streams if a sync is being profiled.
+
+    Args:
+        streams: The tap's streams.
+    """
+    if (profiler := _active.get()) is not None:
+        for stream in streams:
+            profiler.instrument(stream)
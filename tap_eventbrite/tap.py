@@ -4,12 +4,15 @@
 
 from __future__ import annotations
 
-from typing import override
+from pathlib import Path
+from typing import Any, override
 
+import click
 from singer_sdk import Stream, Tap
 from singer_sdk import typing as th
 
-from tap_eventbrite import streams
+from tap_eventbrite import profiling, streams
+from tap_eventbrite.client import EventbriteStream
 
 
 class TapEventbrite(Tap):
@@ -34,11 +37,74 @@ class TapEventbrite(Tap):
             th.DateTimeType,
             description="Earliest datetime to get data from",
         ),
+        th.Property(
+            "state_message_interval",
+            th.IntegerType,
+            default=0,
+            description=(
+                "Minimum number of seconds between STATE messages emitted after each "
+                "organization's events are synced. Final state is always emitted, but "
+                "if the tap crashes, up to this many seconds of resume bookmarks are "
+                "lost and the records since then are sent again."
+            ),
+        ),
     ).to_dict()
 
+    @classmethod
+    @override
+    def get_singer_command(cls) -> click.Command:
+        command = super().get_singer_command()
+        command.params.append(
+            click.Option(
+                ["--profile"],
+                help=(
+                    "Profile the sync and write a pstats file and a per-stream summary "
+                    "to this directory."
+                ),
+                type=click.Path(file_okay=False, path_type=Path),
+            ),
+        )
+        command.params.append(
+            click.Option(
+                ["--profile-memory"],
+                is_flag=True,
+                help=(
+                    "With --profile, trace memory allocations per stream instead of "
+                    "profiling function calls. Timings are inflated by the tracing."
+                ),
+            ),
+        )
+        return command
+
+    @classmethod
+    @override
+    def invoke(
+        cls,
+        *,
+        profile: Path | None = None,
+        profile_memory: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if profile is None:
+            super().invoke(**kwargs)
+            return
+
+        with profiling.SyncProfiler(profile, memory=profile_memory):
+            super().invoke(**kwargs)
+        cls.logger.info("Wrote sync profile to %s", profile)
+
+    @override
+    def load_state(self, state: dict[str, Any]) -> None:
+        super().load_state(state)
+        for stream in self.streams.values():
+            if isinstance(stream, EventbriteStream):
+                stream.compact_state()
+
     @override
     def discover_streams(self) -> list[Stream]:
-        return [
+        tap_streams: list[Stream] = [
             streams.Organizations(tap=self),
             streams.Events(tap=self),
         ]
+        profiling.instrument(tap_streams)
+        return tap_streams
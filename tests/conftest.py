@@ -3,3 +3,86 @@
 """Pytest configuration for tests in this directory."""
 
 from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class MockAPI:
+    """A local HTTP server serving canned Eventbrite API responses."""
+
+    def __init__(self, base_url: str) -> None:
+        """Initialize the mock API."""
+        self.base_url = base_url
+        self.routes: dict[str, Callable[[dict[str, list[str]]], tuple[int, Any]]] = {}
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+        self.keep_requests = True
+
+    def add_pages(self, path: str, key: str, pages: list[list[dict[str, Any]]]) -> None:
+        """Serve the given records as continuation-paginated pages."""
+
+        def route(params: dict[str, list[str]]) -> tuple[int, Any]:
+            index = int(params.get("continuation", ["0"])[0])
+            has_more = index + 1 < len(pages)
+            return 200, {
+                key: pages[index],
+                "pagination": {
+                    "has_more_items": has_more,
+                    "continuation": str(index + 1) if has_more else None,
+                },
+            }
+
+        self.routes[path] = route
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        if self.server.api.keep_requests:
+            self.server.api.requests.append((url.path, params))
+
+        route = self.server.api.routes.get(url.path)
+        status, body = route(params) if route else (404, {"error": "NOT_FOUND"})
+        payload = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # ruff: ignore[builtin-argument-shadowing]
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    api: MockAPI
+
+
+@pytest.fixture
+def mock_api() -> Iterator[MockAPI]:
+    """Run a local mock of the Eventbrite API for the duration of a test.
+
+    Yields:
+        The mock API, to register routes and inspect requests.
+    """
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.api = MockAPI(f"http://127.0.0.1:{server.server_port}")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.api
+    finally:
+        server.shutdown()
+        server.server_close()
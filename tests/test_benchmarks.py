@@ -0,0 +1,161 @@
+# Copyright (c) 2026 Edgar-Ramírez Mondragón
+
+"""Memory and state size benchmarks, run with ``pytest -m benchmark``."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import gc
+import io
+import logging
+import tracemalloc
+from typing import TYPE_CHECKING, Any, override
+
+import pytest
+
+from tap_eventbrite import client
+from tap_eventbrite.tap import TapEventbrite
+
+if TYPE_CHECKING:
+    from tests.conftest import MockAPI
+
+ORGANIZATIONS = 50_000
+# Without compaction every STATE message carries every partition synced so far, so
+# the sync slows down quadratically
+UNCOMPACTED_ORGANIZATIONS = 2_000
+ORGANIZATIONS_PER_PAGE = 200
+MAX_STATE_BYTES = 1_000
+
+pytestmark = pytest.mark.benchmark
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class SyncStats:
+    """Memory and state size of a sync."""
+
+    organizations: int
+    peak_bytes: int
+    retained_bytes: int
+    max_state_bytes: int
+
+    @property
+    def retained_bytes_per_organization(self) -> float:
+        """Memory retained per organization synced after the first tenth."""
+        return self.retained_bytes / (0.9 * self.organizations)
+
+
+class _Sink(io.TextIOBase):
+    """Discard Singer messages, keeping the size of the largest STATE message.
+
+    Traced memory is sampled after a tenth of the organizations have been sent, so
+    that memory retained by the rest shows up as growth.
+    """
+
+    def __init__(self, organizations: int) -> None:
+        self.checkpoint = organizations // 10
+        self.organizations = 0
+        self.max_state_bytes = 0
+        self.baseline_bytes = 0
+
+    @override
+    def write(self, s: str) -> int:
+        if s.startswith('{"type":"STATE"'):
+            self.max_state_bytes = max(self.max_state_bytes, len(s))
+        elif s.startswith('{"type":"RECORD","stream":"organizations"'):
+            self.organizations += 1
+            if self.organizations == self.checkpoint:
+                self.baseline_bytes = _traced_memory()
+        return len(s)
+
+
+def _traced_memory() -> int:
+    # Collect reference cycles, e.g. from finished generators, so that only memory
+    # that is still referenced counts
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _events(_: dict[str, list[str]]) -> tuple[int, Any]:
+    return 200, {
+        "events": [{"id": "1"}],
+        "pagination": {"has_more_items": False, "continuation": None},
+    }
+
+
+def _sync(mock_api: MockAPI, organizations: int) -> SyncStats:
+    org_ids = [str(i) for i in range(organizations)]
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [
+            [{"id": org_id} for org_id in org_ids[i : i + ORGANIZATIONS_PER_PAGE]]
+            for i in range(0, organizations, ORGANIZATIONS_PER_PAGE)
+        ],
+    )
+    for org_id in org_ids:
+        mock_api.routes[f"/v3/organizations/{org_id}/events/"] = _events
+    mock_api.keep_requests = False
+
+    sink = _Sink(organizations)
+    eventbrite = TapEventbrite(config={"token": "secret", "base_url": mock_api.base_url})
+    logging.disable(logging.INFO)
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(sink):
+            eventbrite.sync_all()
+        final_bytes = _traced_memory()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+
+    assert sink.organizations == organizations
+    return SyncStats(
+        organizations=organizations,
+        peak_bytes=peak_bytes,
+        retained_bytes=final_bytes - sink.baseline_bytes,
+        max_state_bytes=sink.max_state_bytes,
+    )
+
+
+def _report(label: str, stats: SyncStats) -> None:
+    logger.info(
+        "%s: %d organizations, peak %d bytes, retained %.1f bytes per organization, "
+        "largest STATE message %d bytes",
+        label,
+        stats.organizations,
+        stats.peak_bytes,
+        stats.retained_bytes_per_organization,
+        stats.max_state_bytes,
+    )
+
+
+def test_memory_and_state_do_not_grow_with_organizations(
+    mock_api: MockAPI,
+) -> None:
+    """Syncing many organizations retains no memory or state per organization."""
+    stats = _sync(mock_api, ORGANIZATIONS)
+    _report("compacted", stats)
+
+    assert stats.retained_bytes_per_organization < 1
+    assert stats.max_state_bytes < MAX_STATE_BYTES
+
+
+def test_compaction_bounds_state(
+    mock_api: MockAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without compaction, state and memory grow with every organization synced."""
+    compacted = _sync(mock_api, UNCOMPACTED_ORGANIZATIONS)
+    _report("compacted", compacted)
+
+    monkeypatch.setattr(client, "compact_stream_state", lambda *_, **__: None)
+    uncompacted = _sync(mock_api, UNCOMPACTED_ORGANIZATIONS)
+    _report("uncompacted", uncompacted)
+
+    assert compacted.max_state_bytes < MAX_STATE_BYTES
+    assert uncompacted.max_state_bytes > UNCOMPACTED_ORGANIZATIONS * 10
+    assert uncompacted.retained_bytes > compacted.retained_bytes
@@ -0,0 +1,519 @@
+# Copyright (c) 2026 Edgar-Ramírez Mondragón
+
+"""Tests for the REST client helpers."""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from typing import TYPE_CHECKING, Any, override
+
+import pytest
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+
+from tap_eventbrite.client import AdaptivePageSize, compact_stream_state, get_error_code
+from tap_eventbrite.streams import Events, Organizations
+from tap_eventbrite.tap import TapEventbrite
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from singer_sdk import Stream
+
+    from tests.conftest import MockAPI
+
+INITIAL_PAGE_SIZE = 80
+MIN_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 200
+MAX_TIMEOUT = 300
+TARGET_LATENCY = 2.0
+FAST = 0.1
+SMALL_BODY = 1_000
+DEFAULT_PAGE_SIZE = 50
+REQUEST_TIMEOUT = 1
+
+
+def test_page_size_grows_on_fast_responses() -> None:
+    """Pages grow while responses are fast and small."""
+    tuner = AdaptivePageSize(initial=INITIAL_PAGE_SIZE, maximum=MAX_PAGE_SIZE)
+
+    tuner.observe(FAST, SMALL_BODY)
+    assert tuner.page_size == INITIAL_PAGE_SIZE * 3 // 2
+
+    for _ in range(5):
+        tuner.observe(FAST, SMALL_BODY)
+    assert tuner.page_size == MAX_PAGE_SIZE
+
+
+def test_page_size_shrinks_on_slow_or_large_responses() -> None:
+    """Pages shrink on slow, large or failed responses."""
+    tuner = AdaptivePageSize(
+        initial=INITIAL_PAGE_SIZE,
+        minimum=MIN_PAGE_SIZE,
+        target_latency=TARGET_LATENCY,
+    )
+
+    tuner.observe(TARGET_LATENCY * 5, SMALL_BODY)
+    assert tuner.page_size == INITIAL_PAGE_SIZE // 2
+
+    tuner.observe(FAST, tuner.max_page_bytes + 1)
+    assert tuner.page_size == INITIAL_PAGE_SIZE // 4
+
+    tuner.observe_failure()
+    tuner.observe_failure()
+    assert tuner.page_size == MIN_PAGE_SIZE
+
+
+def test_page_size_holds_between_thresholds() -> None:
+    """Page size is kept when latency is acceptable but not low."""
+    tuner = AdaptivePageSize(initial=INITIAL_PAGE_SIZE, target_latency=TARGET_LATENCY)
+    tuner.observe(TARGET_LATENCY * 1.5, SMALL_BODY)
+    assert tuner.page_size == INITIAL_PAGE_SIZE
+
+
+def test_timeout_from_latency_percentile() -> None:
+    """Timeout follows the latency percentile once enough samples exist."""
+    tuner = AdaptivePageSize(min_timeout=1, max_timeout=MAX_TIMEOUT, timeout_factor=3.0)
+    assert tuner.timeout == MAX_TIMEOUT
+
+    for _ in range(10):
+        tuner.observe(TARGET_LATENCY, SMALL_BODY)
+    expected = math.ceil(TARGET_LATENCY * 3.0)
+    assert tuner.timeout == expected
+
+    tuner.observe_failure()
+    assert tuner.timeout > expected
+
+
+def test_error_codes_are_classified(mock_api: MockAPI) -> None:
+    """Eventbrite error codes decide whether a failed request is retried."""
+    mock_api.routes["/v3/users/me/organizations/"] = lambda _: (
+        400,
+        {"error": "HIT_RATE_LIMIT", "status_code": 400},
+    )
+    tap = TapEventbrite(config={"token": "secret", "base_url": mock_api.base_url})
+    stream = Organizations(tap=tap)
+    response = stream.requests_session.get(f"{mock_api.base_url}{stream.path}")
+
+    assert get_error_code(response) == "HIT_RATE_LIMIT"
+    with pytest.raises(RetriableAPIError):
+        stream.validate_response(response)
+
+    mock_api.routes["/v3/users/me/organizations/"] = lambda _: (
+        500,
+        {"error": "NOT_AUTHORIZED", "status_code": 500},
+    )
+    response = stream.requests_session.get(f"{mock_api.base_url}{stream.path}")
+    with pytest.raises(FatalAPIError):
+        stream.validate_response(response)
+
+
+def _add_organizations(mock_api: MockAPI, pages: list[list[str]]) -> None:
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [[{"id": org_id} for org_id in page] for page in pages],
+    )
+    for page in pages:
+        for org_id in page:
+            mock_api.add_pages(f"/v3/organizations/{org_id}/events/", "events", [[]])
+
+
+class NoBackoffOrganizations(Organizations):
+    """Organizations retried without waiting."""
+
+    @override
+    def backoff_wait_generator(self) -> Generator[float, None, None]:
+        while True:
+            yield 0
+
+
+def _time_out() -> tuple[int, Any]:
+    time.sleep(REQUEST_TIMEOUT + 0.5)
+    return 200, {}
+
+
+def _gateway_time_out() -> tuple[int, Any]:
+    return 504, {}
+
+
+@pytest.mark.parametrize(
+    "slow_response",
+    [
+        pytest.param(_time_out, id="timeout"),
+        pytest.param(_gateway_time_out, id="gateway-timeout"),
+    ],
+)
+def test_timed_out_page_is_retried_smaller(
+    mock_api: MockAPI,
+    slow_response: Callable[[], tuple[int, Any]],
+) -> None:
+    """A page that times out is retried with a smaller page size."""
+    _add_organizations(mock_api, [["1"]])
+    pages = mock_api.routes["/v3/users/me/organizations/"]
+    mock_api.routes["/v3/users/me/organizations/"] = lambda params: (
+        slow_response() if int(params["page_size"][0]) >= DEFAULT_PAGE_SIZE else pages(params)
+    )
+
+    tap = TapEventbrite(config={"token": "secret", "base_url": mock_api.base_url})
+    stream = NoBackoffOrganizations(tap=tap)
+    stream.page_tuner.max_timeout = REQUEST_TIMEOUT
+
+    assert [record["id"] for record in stream.get_records(None)] == ["1"]
+    assert [params["page_size"] for _, params in mock_api.requests] == [
+        [str(DEFAULT_PAGE_SIZE)],
+        [str(DEFAULT_PAGE_SIZE // 2)],
+    ]
+
+
+def _messages(capsys: pytest.CaptureFixture[str]) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def _organization_ids(messages: list[dict[str, Any]]) -> list[str]:
+    return [
+        m["record"]["id"]
+        for m in messages
+        if m["type"] == "RECORD" and m["stream"] == "organizations"
+    ]
+
+
+@pytest.mark.parametrize(
+    ("continuation", "last_record_id", "expected"),
+    [
+        pytest.param("1", "3", ["4", "5"], id="mid-page"),
+        pytest.param(None, "2", ["3", "4", "5"], id="end-of-page"),
+        pytest.param("2", "5", [], id="end-of-last-page"),
+    ],
+)
+def test_resume_skips_emitted_records(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+    continuation: str | None,
+    last_record_id: str,
+    expected: list[str],
+) -> None:
+    """An interrupted sync resumes at the bookmarked page and skips sent records."""
+    _add_organizations(mock_api, [["1", "2"], ["3", "4"], ["5"]])
+
+    state = {
+        "bookmarks": {
+            "organizations": {
+                "resume": {
+                    "continuation": continuation,
+                    "page_size": 2,
+                    "last_record_id": last_record_id,
+                },
+            },
+        },
+    }
+    tap = TapEventbrite(
+        config={"token": "secret", "base_url": mock_api.base_url},
+        state=state,
+    )
+    tap.sync_all()
+
+    messages = _messages(capsys)
+    assert _organization_ids(messages) == expected
+    expected_params = {"page_size": ["2"]}
+    if continuation:
+        expected_params["continuation"] = [continuation]
+    assert mock_api.requests[0] == ("/v3/users/me/organizations/", expected_params)
+
+    final_state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+    assert "resume" not in final_state["bookmarks"]["organizations"]
+
+
+def test_failed_sync_resumes_without_gaps(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Restarting from the state of a failed sync sends every record exactly once."""
+    _add_organizations(mock_api, [["1", "2"], ["3"]])
+    pages = mock_api.routes["/v3/users/me/organizations/"]
+    mock_api.routes["/v3/users/me/organizations/"] = lambda params: (
+        (404, {"error": "NOT_FOUND"}) if "continuation" in params else pages(params)
+    )
+
+    config = {"token": "secret", "base_url": mock_api.base_url}
+    with pytest.raises(FatalAPIError):
+        TapEventbrite(config=config).sync_all()
+
+    messages = _messages(capsys)
+    state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+
+    mock_api.routes["/v3/users/me/organizations/"] = pages
+    TapEventbrite(config=config, state=state).sync_all()
+
+    messages += _messages(capsys)
+    assert _organization_ids(messages) == ["1", "2", "3"]
+
+
+def test_failed_sync_leaves_resume_bookmark(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A sync that fails mid-pagination records where to resume."""
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [[{"id": "1"}, {"id": "2"}], [{"id": "3"}]],
+    )
+    pages = mock_api.routes["/v3/users/me/organizations/"]
+    mock_api.routes["/v3/users/me/organizations/"] = lambda params: (
+        (404, {"error": "NOT_FOUND"}) if "continuation" in params else pages(params)
+    )
+    for org_id in "12":
+        mock_api.add_pages(
+            f"/v3/organizations/{org_id}/events/",
+            "events",
+            [[{"id": f"{org_id}0"}]],
+        )
+
+    tap = TapEventbrite(config={"token": "secret", "base_url": mock_api.base_url})
+    with pytest.raises(FatalAPIError):
+        tap.sync_all()
+
+    messages = _messages(capsys)
+    last_state = next(m["value"] for m in reversed(messages) if m["type"] == "STATE")
+    assert last_state["bookmarks"]["organizations"]["resume"] == {
+        "continuation": None,
+        "page_size": DEFAULT_PAGE_SIZE,
+        "last_record_id": "2",
+    }
+
+
+def test_rejected_resume_token_restarts_partition(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A stale continuation token makes the partition sync from the first page."""
+    _add_organizations(mock_api, [["1", "2"], ["3"]])
+    pages = mock_api.routes["/v3/users/me/organizations/"]
+    mock_api.routes["/v3/users/me/organizations/"] = lambda params: (
+        (400, {"error": "BAD_PAGE"}) if params.get("continuation") == ["stale"] else pages(params)
+    )
+
+    state = {
+        "bookmarks": {
+            "organizations": {
+                "resume": {"continuation": "stale", "page_size": 2, "last_record_id": "1"},
+            },
+        },
+    }
+    tap = TapEventbrite(
+        config={"token": "secret", "base_url": mock_api.base_url},
+        state=state,
+    )
+    tap.sync_all()
+
+    messages = _messages(capsys)
+    assert _organization_ids(messages) == ["1", "2", "3"]
+    assert "resume" not in tap.state["bookmarks"]["organizations"]
+
+
+def test_no_resume_with_activate_version(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Full-table syncs that emit ACTIVATE_VERSION don't skip any records."""
+    _add_organizations(mock_api, [["1", "2"], ["3"]])
+
+    state = {
+        "bookmarks": {
+            "organizations": {
+                "resume": {"continuation": "1", "page_size": 2, "last_record_id": "3"},
+            },
+        },
+    }
+    tap = TapEventbrite(
+        config={
+            "token": "secret",
+            "base_url": mock_api.base_url,
+            "emit_activate_version_messages": True,
+        },
+        state=state,
+    )
+    tap.sync_all()
+
+    messages = _messages(capsys)
+    assert _organization_ids(messages) == ["1", "2", "3"]
+    assert "resume" not in tap.state["bookmarks"]["organizations"]
+
+
+def test_compact_stream_state() -> None:
+    """Finished and stale partitions are dropped from state."""
+    stream_state: dict[str, Any] = {
+        "partitions": [
+            {"context": {"organization_id": "1"}},
+            {"context": {"organization_id": "2"}, "progress_markers": {}},
+            {
+                "context": {"organization_id": "3"},
+                "resume": {"continuation": "abc", "last_record_id": "30"},
+            },
+            {
+                "context": {"organization_id": "4"},
+                "replication_key": "changed",
+                "replication_key_value": "2023-01-01T00:00:00Z",
+            },
+            {
+                "context": {"organization_id": "5"},
+                "replication_key": "changed",
+                "replication_key_value": "2025-01-01T00:00:00Z",
+            },
+        ],
+    }
+    compact_stream_state(stream_state, "2024-01-01")
+
+    assert stream_state == {
+        "partitions": [
+            {
+                "context": {"organization_id": "3"},
+                "resume": {"continuation": "abc", "last_record_id": "30"},
+            },
+            {
+                "context": {"organization_id": "5"},
+                "replication_key": "changed",
+                "replication_key_value": "2025-01-01T00:00:00Z",
+            },
+        ],
+    }
+
+    stream_state = {"partitions": [{"context": {"organization_id": "1"}}]}
+    compact_stream_state(stream_state)
+    assert stream_state == {}
+
+
+def test_state_messages_stay_small(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Finished partitions leave no state behind and child state can be throttled."""
+    org_ids = [str(i) for i in range(1, 21)]
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [[{"id": org_id} for org_id in org_ids]],
+    )
+    for org_id in org_ids:
+        mock_api.add_pages(
+            f"/v3/organizations/{org_id}/events/",
+            "events",
+            [[{"id": f"{org_id}-1"}, {"id": f"{org_id}-2"}, {"id": f"{org_id}-3"}]],
+        )
+
+    tap = TapEventbrite(
+        config={
+            "token": "secret",
+            "base_url": mock_api.base_url,
+            "state_message_interval": 3600,
+        },
+    )
+    tap.sync_all()
+
+    messages = _messages(capsys)
+    states = [m["value"] for m in messages if m["type"] == "STATE"]
+    assert len(states) < len(org_ids)
+    assert states[-1] == {"bookmarks": {"organizations": {}, "events": {}}}
+
+
+class IncrementalEvents(Events):
+    """Events replicated incrementally, to exercise per-partition bookmarks."""
+
+    replication_key = "changed"  # type: ignore[assignment]
+
+
+class IncrementalTapEventbrite(TapEventbrite):
+    """Tap with an incremental child stream."""
+
+    @override
+    def discover_streams(self) -> list[Stream]:
+        return [Organizations(tap=self), IncrementalEvents(tap=self)]
+
+
+class StatusEvents(Events):
+    """Events replicated by a replication key that is not a timestamp."""
+
+    replication_key = "status"  # type: ignore[assignment]
+
+
+class StatusTapEventbrite(TapEventbrite):
+    """Tap with a child stream whose replication key is not a timestamp."""
+
+    @override
+    def discover_streams(self) -> list[Stream]:
+        return [Organizations(tap=self), StatusEvents(tap=self)]
+
+
+@pytest.mark.parametrize(
+    ("tap_class", "dropped"),
+    [
+        pytest.param(IncrementalTapEventbrite, True, id="timestamp"),
+        pytest.param(StatusTapEventbrite, False, id="not-timestamp"),
+        pytest.param(TapEventbrite, False, id="full-table"),
+    ],
+)
+def test_start_date_drops_only_timestamp_bookmarks(
+    tap_class: type[TapEventbrite],
+    *,
+    dropped: bool,
+) -> None:
+    """Bookmarks before the start date are dropped only for timestamp replication keys."""
+    partitions = [
+        {
+            "context": {"organization_id": "1"},
+            "replication_key": "changed",
+            "replication_key_value": "2023-01-01T00:00:00Z",
+        },
+    ]
+    tap = tap_class(
+        config={"token": "secret", "base_url": "https://example.com", "start_date": "2024-01-01"},
+        state={"bookmarks": {"events": {"partitions": partitions}}},
+    )
+
+    events_state = tap.state["bookmarks"]["events"]
+    assert events_state.get("partitions") == (None if dropped else partitions)
+
+
+def test_throttled_state_ends_with_full_state(
+    mock_api: MockAPI,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """With throttled child state, the last STATE message still has every bookmark."""
+    org_ids = [str(i) for i in range(1, 21)]
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [[{"id": org_id} for org_id in org_ids]],
+    )
+    for org_id in org_ids:
+        mock_api.add_pages(
+            f"/v3/organizations/{org_id}/events/",
+            "events",
+            [
+                [
+                    {"id": f"{org_id}-1", "changed": "2025-01-01T00:00:00Z"},
+                    {"id": f"{org_id}-2", "changed": f"2025-02-{org_id:0>2}T00:00:00Z"},
+                ],
+            ],
+        )
+
+    tap = IncrementalTapEventbrite(
+        config={
+            "token": "secret",
+            "base_url": mock_api.base_url,
+            "state_message_interval": 3600,
+        },
+    )
+    tap.sync_all()
+
+    messages = _messages(capsys)
+    states = [m["value"] for m in messages if m["type"] == "STATE"]
+    assert len(states) < len(org_ids)
+    assert states[-1] == tap.state
+
+    partitions = states[-1]["bookmarks"]["events"]["partitions"]
+    assert len(partitions) == len(org_ids)
+    assert all("resume" not in partition for partition in partitions)
+    assert partitions[-1]["replication_key_value"] == "2025-02-20T00:00:00Z"
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 Edgar-Ramírez Mondragón
+
+"""Tests for sync profiling."""
+
+from __future__ import annotations
+
+import json
+import pstats
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from tap_eventbrite.profiling import PHASES, PSTATS_FILENAME, SUMMARY_FILENAME
+from tap_eventbrite.tap import TapEventbrite
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import MockAPI
+
+ORG_IDS = ("1", "2")
+EVENTS_PER_ORG = 2
+TIMED_PHASES = ("fetch", "conform", "output")
+
+
+def _add_pages(mock_api: MockAPI) -> None:
+    mock_api.add_pages(
+        "/v3/users/me/organizations/",
+        "organizations",
+        [[{"id": org_id}] for org_id in ORG_IDS],
+    )
+    for org_id in ORG_IDS:
+        mock_api.add_pages(
+            f"/v3/organizations/{org_id}/events/",
+            "events",
+            [[{"id": f"{org_id}-{i}"} for i in range(EVENTS_PER_ORG)]],
+        )
+
+
+def _profile(mock_api: MockAPI, tmp_path: Path, *args: str) -> Path:
+    _add_pages(mock_api)
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"token": "secret", "base_url": mock_api.base_url}))
+    profile = tmp_path / "profile"
+
+    result = CliRunner().invoke(
+        TapEventbrite.cli,
+        ["--config", str(config), "--profile", str(profile), *args],
+    )
+    assert result.exit_code == 0, result.output
+    return profile
+
+
+def test_profile_sync(mock_api: MockAPI, tmp_path: Path) -> None:
+    """A profiled sync writes a pstats file and a per-phase stream summary."""
+    profile = _profile(mock_api, tmp_path)
+
+    stats = pstats.Stats(str(profile / PSTATS_FILENAME))
+    assert stats.total_tt > 0  # type: ignore[attr-defined]
+
+    summary = json.loads((profile / SUMMARY_FILENAME).read_text())
+    assert summary["seconds"] > 0
+    assert summary["streams"]["organizations"]["records"] == len(ORG_IDS)
+    assert summary["streams"]["events"]["records"] == len(ORG_IDS) * EVENTS_PER_ORG
+
+    parent_seconds = 0.0
+    for stream in summary["streams"].values():
+        assert set(stream["phases"]) == set(PHASES)
+        for phase in TIMED_PHASES:
+            assert stream["phases"][phase]["seconds"] > 0
+        assert all("allocated_bytes" not in p for p in stream["phases"].values())
+        parent_seconds += sum(p["seconds"] for p in stream["phases"].values())
+
+    # Child syncs are not counted twice
+    assert parent_seconds <= summary["seconds"]
+
+
+def test_profile_memory(mock_api: MockAPI, tmp_path: Path) -> None:
+    """A memory pass reports allocations per phase and skips cProfile."""
+    profile = _profile(mock_api, tmp_path, "--profile-memory")
+
+    assert not (profile / PSTATS_FILENAME).exists()
+    summary = json.loads((profile / SUMMARY_FILENAME).read_text())
+    for stream in summary["streams"].values():
+        assert stream["phases"]["fetch"]["allocated_bytes"] > 0